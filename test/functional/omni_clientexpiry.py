@@ -9,28 +9,30 @@ from test_framework.test_framework import BitcoinTestFramework
 class OmniClientExpiry(BitcoinTestFramework):
     def set_test_params(self):
         self.num_nodes = 1
-        self.setup_clean_chain = True
+        # Use the cached chain, its 200 blocks provide mature coins
+        self.setup_clean_chain = False
         self.extra_args = [['-omnialertallowsender=any']]
 
     def run_test(self):
         self.log.info("test client expiry")
 
-        # Preparing some mature Bitcoins
-        coinbase_address = self.nodes[0].getnewaddress()
-        self.nodes[0].generatetoaddress(101, coinbase_address)
+        node = self.nodes[0]
+
+        # The cached chain already provides mature Bitcoins
+        coinbase_address = node.getnewaddress()
 
         # Obtaining a master address to work with
-        address = self.nodes[0].getnewaddress()
+        address = node.getnewaddress()
 
         # Funding the address with some testnet BTC for fees
-        self.nodes[0].sendtoaddress(address, 20)
-        self.nodes[0].generatetoaddress(1, coinbase_address)
+        node.sendtoaddress(address, 20)
+        node.generatetoaddress(1, coinbase_address)
 
         # Sending an alert with client expiry version of 999999999
-        self.nodes[0].omni_sendalert(address, 3, 999999999, "Client version out of date test.")
+        node.omni_sendalert(address, 3, 999999999, "Client version out of date test.")
 
         # Generating a block should make the client shutdown
-        self.nodes[0].generatetoaddress(10, coinbase_address)
+        node.generatetoaddress(10, coinbase_address)
 
 if __name__ == '__main__':
     # We expect the client to shutdown during this test, this will raise an AssertionError, if no
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2020 The Bitcoin Core developers
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or http://www.opensource.org/licenses/mit-license.php.
+#
+# Check for circular dependencies
+
+import glob
+import os
+import subprocess
+import sys
+
+EXPECTED_CIRCULAR_DEPENDENCIES = frozenset({
+    "chainparamsbase -> util/system -> chainparamsbase",
+    "index/txindex -> validation -> index/txindex",
+    "policy/fees -> txmempool -> policy/fees",
+    "qt/addresstablemodel -> qt/walletmodel -> qt/addresstablemodel",
+    "qt/bitcoingui -> qt/walletframe -> qt/bitcoingui",
+    "qt/recentrequeststablemodel -> qt/walletmodel -> qt/recentrequeststablemodel",
+    "qt/sendcoinsdialog -> qt/walletmodel -> qt/sendcoinsdialog",
+    "qt/transactiontablemodel -> qt/walletmodel -> qt/transactiontablemodel",
+    "txmempool -> validation -> txmempool",
+    "wallet/fees -> wallet/wallet -> wallet/fees",
+    "wallet/wallet -> wallet/walletdb -> wallet/wallet",
+    "policy/fees -> txmempool -> validation -> policy/fees",
+    "omnicore/dbspinfo -> omnicore/omnicore -> omnicore/dbspinfo",
+    "omnicore/dbtradelist -> omnicore/mdex -> omnicore/dbtradelist",
+    "omnicore/dbtxlist -> omnicore/dex -> omnicore/dbtxlist",
+    "omnicore/dbtxlist -> omnicore/omnicore -> omnicore/dbtxlist",
+    "omnicore/dbtxlist -> omnicore/tx -> omnicore/dbtxlist",
+    "omnicore/dex -> omnicore/omnicore -> omnicore/dex",
+    "omnicore/dex -> omnicore/tx -> omnicore/dex",
+    "omnicore/mdex -> omnicore/tx -> omnicore/mdex",
+    "omnicore/omnicore -> omnicore/rules -> omnicore/omnicore",
+    "omnicore/omnicore -> omnicore/sp -> omnicore/omnicore",
+    "omnicore/omnicore -> omnicore/tally -> omnicore/omnicore",
+    "omnicore/omnicore -> omnicore/tx -> omnicore/omnicore",
+    "omnicore/omnicore -> omnicore/walletcache -> omnicore/omnicore",
+    "omnicore/omnicore -> omnicore/walletutils -> omnicore/omnicore",
+    "omnicore/consensushash -> omnicore/dbspinfo -> omnicore/omnicore -> omnicore/consensushash",
+    "omnicore/consensushash -> omnicore/dex -> omnicore/rules -> omnicore/consensushash",
+    "omnicore/dbfees -> omnicore/sto -> omnicore/omnicore -> omnicore/dbfees",
+    "omnicore/dbspinfo -> omnicore/omnicore -> omnicore/sp -> omnicore/dbspinfo",
+    "omnicore/dbspinfo -> omnicore/omnicore -> omnicore/tx -> omnicore/dbspinfo",
+    "omnicore/dbtradelist -> omnicore/mdex -> omnicore/tx -> omnicore/dbtradelist",
+    "omnicore/dbtransaction -> omnicore/errors -> omnicore/omnicore -> omnicore/dbtransaction",
+    "omnicore/dbtxlist -> omnicore/omnicore -> omnicore/mdex -> omnicore/dbtxlist",
+    "omnicore/dbtxlist -> omnicore/dex -> omnicore/rules -> omnicore/dbtxlist",
+    "omnicore/dex -> omnicore/omnicore -> omnicore/persistence -> omnicore/dex",
+    "omnicore/omnicore -> omnicore/tx -> omnicore/sto -> omnicore/omnicore",
+    "init -> txmempool -> omnicore/omnicore -> init",
+    "omnicore/omnicore -> omnicore/pending -> txmempool -> omnicore/omnicore",
+    "txdb -> validation -> txdb",
+    "omnicore/nftdb -> omnicore/omnicore -> omnicore/tx -> omnicore/nftdb",
+})
+
+CODE_DIR = "src"
+
+
+CIRCULAR_DEPENDENCY_PREFIX = "Circular dependency: "
+
+
+def main():
+    os.chdir(CODE_DIR)
+    files = []
+    for path in ("*", "*/*", "*/*/*"):
+        for extension in ("h", "cpp"):
+            files.extend(glob.glob("{}.{}".format(path, extension)))
+
+    command = [sys.executable, "../contrib/devtools/circular-dependencies.py"] + files
+    proc = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        bufsize=1,
+    )
+
+    # Collect the reported cycles as they arrive, without buffering the
+    # full scanner output
+    circular_dependencies = set()
+    for line in proc.stdout:
+        dependency = line.rstrip("\n")
+        if dependency.startswith(CIRCULAR_DEPENDENCY_PREFIX):
+            dependency = dependency[len(CIRCULAR_DEPENDENCY_PREFIX):]
+        circular_dependencies.add(dependency)
+    proc.wait()
+
+    # The unexpected and missing dependencies are the two sides of a set diff
+    unexpected = circular_dependencies - EXPECTED_CIRCULAR_DEPENDENCIES
+    missing = EXPECTED_CIRCULAR_DEPENDENCIES - circular_dependencies
+
+    for dependency in sorted(unexpected):
+        print(
+            'A new circular dependency in the form of "{}" appears to have been introduced.\n'.format(dependency)
+        )
+
+    for expected_dependency in sorted(missing):
+        print(
+            'Good job! The circular dependency "{}" is no longer present.'.format(expected_dependency)
+        )
+        print(
+            "Please remove it from EXPECTED_CIRCULAR_DEPENDENCIES in {}".format(__file__)
+        )
+        print(
+            "to make sure this circular dependency is not accidentally reintroduced.\n"
+        )
+
+    sys.exit(1 if unexpected or missing else 0)
+
+
+if __name__ == "__main__":
+    main()